@@ -2,6 +2,7 @@ package server
 
 import (
 	"context"
+	"crypto/rand"
 	"encoding/json"
 	"errors"
 	"net/http"
@@ -377,9 +378,17 @@ func generateTraceID() string {
 
 func generateRandomString(length int) string {
 	const charset = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-	b := make([]byte, length)
-	for i := range b {
-		b[i] = charset[time.Now().UnixNano()%int64(len(charset))]
+	// 丢弃 >= maxByte 的字节，保证每个字符等概率出现
+	const maxByte = 256 - 256%len(charset)
+	result := make([]byte, 0, length)
+	buf := make([]byte, length)
+	for len(result) < length {
+		rand.Read(buf)
+		for _, v := range buf {
+			if int(v) < maxByte && len(result) < length {
+				result = append(result, charset[int(v)%len(charset)])
+			}
+		}
 	}
-	return string(b)
+	return string(result)
 }
@@ -0,0 +1,31 @@
+package server
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestGenerateRandomString(t *testing.T) {
+	const charset = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+	for _, length := range []int{0, 1, 8, 12, 64} {
+		s := generateRandomString(length)
+		if len(s) != length {
+			t.Fatalf("长度不符: want %d, got %d", length, len(s))
+		}
+		for _, c := range s {
+			if !strings.ContainsRune(charset, c) {
+				t.Fatalf("字符 %q 不在字符集中", c)
+			}
+		}
+	}
+
+	seen := make(map[string]struct{})
+	for i := 0; i < 1000; i++ {
+		s := generateRandomString(12)
+		if _, ok := seen[s]; ok {
+			t.Fatalf("生成了重复的字符串: %s", s)
+		}
+		seen[s] = struct{}{}
+	}
+}